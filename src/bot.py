@@ -12,9 +12,52 @@ import subprocess
 import time
 import html
 import requests
+from requests.adapters import HTTPAdapter
+from collections import Counter, defaultdict
 from pathlib import Path
 from datetime import datetime
 
+# First number in a price string, e.g. "RM 350,000.00" -> "350,000.00".
+# At most one decimal point is matched, so float() always accepts it
+_PRICE_RE = re.compile(r"(\d[\d,]*(?:\.\d+)?)")
+
+# /help reply; constant, so built once at import
+_HELP_TEXT = (
+    "🤖 <b>Lelong Property Bot - Commands</b>\n\n"
+    "<b>Search:</b>\n"
+    "/search <i>keyword</i> - Search by keyword\n"
+    "/type <i>type</i> - Filter by type (factory, shop, land, hotel, office, warehouse, semid)\n"
+    "/under <i>price</i> - Properties under price (e.g. /under 500000)\n"
+    "/above <i>price</i> - Properties above price\n"
+    "/location <i>area</i> - Filter by location\n\n"
+    "<b>Status:</b>\n"
+    "/status - Latest scan statistics\n"
+    "/new - New listings from last scan\n"
+    "/changes - Recent property changes\n"
+    "/summary - Market summary by type\n"
+    "/reload - Refresh latest data from GitHub\n"
+)
+
+
+def _iter_message_parts(text, max_length):
+    """Yield pieces of text no longer than max_length, cut at the last newline
+    in each window (or hard at max_length if there is none). Newlines at a cut
+    are dropped. Walks the string by index rather than re-slicing the rest.
+
+    Duplicated in monitor.py (the bot stays importable without the scraper's
+    dependencies); keep the two copies in sync."""
+    start = 0
+    end = len(text)
+    while end - start > max_length:
+        split_at = text.rfind("\n", start, start + max_length)
+        if split_at == -1:
+            split_at = start + max_length
+        yield text[start:split_at]
+        start = split_at
+        while start < end and text[start] == "\n":
+            start += 1
+    yield text[start:]
+
 
 class PropertyBot:
     def __init__(self):
@@ -22,6 +65,11 @@ class PropertyBot:
         self.chat_id = os.getenv("TELEGRAM_CHAT_ID", "")
         self.api_url = f"https://api.telegram.org/bot{self.token}"
 
+        # Shared session for Telegram and GitHub raw fetches: keeps connections
+        # alive across polls, message parts and data files
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
         # Data paths
         self.base_path = (
             Path(__file__).parent.parent
@@ -43,6 +91,7 @@ class PropertyBot:
 
         self.last_update_id = 0
         self.properties = {}
+        self._json_cache = {}  # path -> ((mtime_ns, size), parsed data)
         self.data_loaded_at = datetime.now()
         self.auto_refresh_hours = 6  # refresh from GitHub every 6 hours
 
@@ -54,6 +103,13 @@ class PropertyBot:
         """Escape text for Telegram HTML."""
         return html.escape(str(text), quote=True)
 
+    def format_scan_date(self, value):
+        """Format an ISO scan timestamp for display; pass anything else through."""
+        try:
+            return datetime.fromisoformat(value).strftime("%d %b %Y, %I:%M %p")
+        except (ValueError, TypeError):
+            return value
+
     def load_data(self):
         """Load property data from local files into memory."""
         try:
@@ -110,7 +166,7 @@ class PropertyBot:
 
         for remote_path, local_path in files_to_fetch.items():
             try:
-                resp = requests.get(f"{base}/{remote_path}", headers=headers, timeout=60)
+                resp = self.session.get(f"{base}/{remote_path}", headers=headers, timeout=60)
                 if resp.status_code == 200:
                     local_path.parent.mkdir(parents=True, exist_ok=True)
                     with open(local_path, "w", encoding="utf-8") as f:
@@ -122,30 +178,27 @@ class PropertyBot:
                 print(f"Error fetching {remote_path}: {e}")
 
     def load_json(self, filepath):
-        """Load a JSON file."""
+        """Load a JSON file, reusing the parsed data until the file changes."""
         try:
             if filepath.exists():
+                st = filepath.stat()
+                key = (st.st_mtime_ns, st.st_size)
+                cached = self._json_cache.get(filepath)
+                if cached and cached[0] == key:
+                    return cached[1]
                 with open(filepath, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                    data = json.load(f)
+                self._json_cache[filepath] = (key, data)
+                return data
         except Exception as e:
             print(f"Error loading {filepath}: {e}")
         return None
 
     def send_message(self, chat_id, text):
         """Send a message, splitting if too long."""
-        max_len = 4000
-        parts = []
-        while len(text) > max_len:
-            split_at = text.rfind("\n", 0, max_len)
-            if split_at == -1:
-                split_at = max_len
-            parts.append(text[:split_at])
-            text = text[split_at:].lstrip("\n")
-        parts.append(text)
-
-        for part in parts:
+        for part in _iter_message_parts(text, 4000):
             try:
-                requests.post(
+                self.session.post(
                     f"{self.api_url}/sendMessage",
                     json={
                         "chat_id": chat_id,
@@ -162,11 +215,18 @@ class PropertyBot:
         """Extract numeric price from string like 'RM 350,000'."""
         if not price_str:
             return 0
-        nums = re.sub(r"[^\d.]", "", price_str)
-        try:
-            return float(nums)
-        except ValueError:
+        m = _PRICE_RE.search(price_str)
+        if not m:
             return 0
+        return float(m.group(1).replace(",", ""))
+
+    def property_price(self, prop):
+        """Numeric price of a property: the scraper's price_value when
+        present, otherwise parsed from the price string."""
+        price_value = prop.get("price_value")
+        if price_value is not None:
+            return price_value
+        return self.parse_price(prop.get("price", ""))
 
     def format_property(self, prop, idx=None):
         """Format a single property for display."""
@@ -181,68 +241,68 @@ class PropertyBot:
 
         scheme = self.esc(prop.get("scheme_name", ""))
 
-        msg = f"{prefix}<b>{title}</b>\n"
+        lines = [f"{prefix}<b>{title}</b>"]
         if scheme:
-            msg += f"   Scheme: {scheme}\n"
-        msg += f"   Type: {ptype}\n"
-        msg += f"   Price: {price}\n"
-        msg += f"   Location: {location}\n"
-        msg += f"   Size: {size}\n"
-        msg += f"   Auction: {auction}\n"
+            lines.append(f"   Scheme: {scheme}")
+        lines += [
+            f"   Type: {ptype}",
+            f"   Price: {price}",
+            f"   Location: {location}",
+            f"   Size: {size}",
+            f"   Auction: {auction}",
+        ]
         if url:
-            msg += f'   <a href="{url}">View Listing</a>\n'
-        return msg
+            lines.append(f'   <a href="{url}">View Listing</a>')
+        return "\n".join(lines) + "\n"
+
+    def format_results(self, header, results, hint, limit=15):
+        """Format a result list: header, count, the first `limit` properties
+        and a hint on narrowing down if more were found."""
+        parts = [f"{header}\n", f"Found {len(results)} result(s)\n\n"]
+        parts += [
+            self.format_property(prop, i) + "\n"
+            for i, prop in enumerate(results[:limit], 1)
+        ]
+        if len(results) > limit:
+            parts.append(f"\n... and {len(results) - limit} more. {hint}")
+        return "".join(parts)
 
     def cmd_help(self, chat_id):
         """Show available commands."""
-        msg = "🤖 <b>Lelong Property Bot - Commands</b>\n\n"
-        msg += "<b>Search:</b>\n"
-        msg += "/search <i>keyword</i> - Search by keyword\n"
-        msg += "/type <i>type</i> - Filter by type (factory, shop, land, hotel, office, warehouse, semid)\n"
-        msg += "/under <i>price</i> - Properties under price (e.g. /under 500000)\n"
-        msg += "/above <i>price</i> - Properties above price\n"
-        msg += "/location <i>area</i> - Filter by location\n\n"
-        msg += "<b>Status:</b>\n"
-        msg += "/status - Latest scan statistics\n"
-        msg += "/new - New listings from last scan\n"
-        msg += "/changes - Recent property changes\n"
-        msg += "/summary - Market summary by type\n"
-        msg += "/reload - Refresh latest data from GitHub\n"
-        self.send_message(chat_id, msg)
+        self.send_message(chat_id, _HELP_TEXT)
 
     def cmd_status(self, chat_id):
         """Show latest scan stats."""
         stats = self.load_json(self.stats_file)
         progress = self.load_json(self.progress_file)
 
-        msg = "📊 <b>Latest Scan Status</b>\n\n"
+        parts = ["📊 <b>Latest Scan Status</b>\n\n"]
 
         if stats:
-            scan_date = stats.get("date", "Unknown")
-            try:
-                dt = datetime.fromisoformat(scan_date)
-                scan_date = dt.strftime("%d %b %Y, %I:%M %p")
-            except (ValueError, TypeError):
-                pass
-            msg += f"📅 Last Scan: {self.esc(scan_date)}\n"
-            msg += f"📈 Total Listings: {stats.get('total_listings', 0):,}\n"
-            msg += f"📁 Total Tracked: {stats.get('total_tracked', 0):,}\n"
-            msg += f"🆕 New Listings: {stats.get('new_listings', 0)}\n"
-            msg += f"🔄 Changes: {stats.get('changed_properties', 0)}\n\n"
+            scan_date = self.format_scan_date(stats.get("date", "Unknown"))
+            parts += [
+                f"📅 Last Scan: {self.esc(scan_date)}\n",
+                f"📈 Total Listings: {stats.get('total_listings', 0):,}\n",
+                f"📁 Total Tracked: {stats.get('total_tracked', 0):,}\n",
+                f"🆕 New Listings: {stats.get('new_listings', 0)}\n",
+                f"🔄 Changes: {stats.get('changed_properties', 0)}\n\n",
+            ]
 
         if progress:
-            msg += "<b>Scraping Performance:</b>\n"
-            msg += f"• Pages: {progress.get('pages_completed', 0)}/{progress.get('total_pages', 0)}\n"
-            msg += f"• Properties: {progress.get('properties_extracted', 0):,}\n"
-            msg += f"• Success: {progress.get('success_rate', 0):.1f}%\n"
-            msg += f"• Coverage: {progress.get('coverage_percentage', 0):.1f}%\n"
-            msg += f"• Duplicates Filtered: {progress.get('duplicates_skipped', 0):,}\n"
+            parts += [
+                "<b>Scraping Performance:</b>\n",
+                f"• Pages: {progress.get('pages_completed', 0)}/{progress.get('total_pages', 0)}\n",
+                f"• Properties: {progress.get('properties_extracted', 0):,}\n",
+                f"• Success: {progress.get('success_rate', 0):.1f}%\n",
+                f"• Coverage: {progress.get('coverage_percentage', 0):.1f}%\n",
+                f"• Duplicates Filtered: {progress.get('duplicates_skipped', 0):,}\n",
+            ]
 
         if not stats and not progress:
-            msg += "No scan data available yet."
+            parts.append("No scan data available yet.")
 
-        msg += f"\n\n💾 Database: {len(self.properties):,} properties"
-        self.send_message(chat_id, msg)
+        parts.append(f"\n\n💾 Database: {len(self.properties):,} properties")
+        self.send_message(chat_id, "".join(parts))
 
     def cmd_new(self, chat_id):
         """Show new listings from last scan."""
@@ -253,31 +313,28 @@ class PropertyBot:
 
         last_scan = changes[-1]
         new_ids = last_scan.get("new_listing_ids", [])
-        scan_date = last_scan.get("scan_date", "Unknown")
-        try:
-            dt = datetime.fromisoformat(scan_date)
-            scan_date = dt.strftime("%d %b %Y, %I:%M %p")
-        except (ValueError, TypeError):
-            pass
+        scan_date = self.format_scan_date(last_scan.get("scan_date", "Unknown"))
 
         if not new_ids:
             self.send_message(chat_id, f"📭 No new listings found in last scan ({self.esc(scan_date)}).")
             return
 
-        msg = f"🆕 <b>New Listings from {self.esc(scan_date)}</b>\n"
-        msg += f"Found {len(new_ids)} new listing(s)\n\n"
+        parts = [
+            f"🆕 <b>New Listings from {self.esc(scan_date)}</b>\n",
+            f"Found {len(new_ids)} new listing(s)\n\n",
+        ]
 
         count = 0
         for pid in new_ids[:20]:
             prop = self.properties.get(pid)
             if prop:
                 count += 1
-                msg += self.format_property(prop, count) + "\n"
+                parts.append(self.format_property(prop, count) + "\n")
 
         if len(new_ids) > 20:
-            msg += f"\n... and {len(new_ids) - 20} more"
+            parts.append(f"\n... and {len(new_ids) - 20} more")
 
-        self.send_message(chat_id, msg)
+        self.send_message(chat_id, "".join(parts))
 
     def cmd_changes(self, chat_id):
         """Show recent property changes."""
@@ -287,33 +344,32 @@ class PropertyBot:
             return
 
         last_scan = changes[-1]
-        scan_date = last_scan.get("scan_date", "Unknown")
-        try:
-            dt = datetime.fromisoformat(scan_date)
-            scan_date = dt.strftime("%d %b %Y, %I:%M %p")
-        except (ValueError, TypeError):
-            pass
+        scan_date = self.format_scan_date(last_scan.get("scan_date", "Unknown"))
 
         change_list = last_scan.get("changes", [])
         if not change_list:
             self.send_message(chat_id, f"✨ No property changes detected in last scan ({self.esc(scan_date)}).")
             return
 
-        msg = f"🔄 <b>Property Changes from {self.esc(scan_date)}</b>\n"
-        msg += f"Found {len(change_list)} change(s)\n\n"
+        parts = [
+            f"🔄 <b>Property Changes from {self.esc(scan_date)}</b>\n",
+            f"Found {len(change_list)} change(s)\n\n",
+        ]
 
         for i, change in enumerate(change_list[:20], 1):
             title = self.esc(change.get("title", "Unknown"))
             field = self.esc(change.get("field", ""))
             old_val = self.esc(change.get("old_value", ""))
             new_val = self.esc(change.get("new_value", ""))
-            msg += f"<b>{i}. {title}</b>\n"
-            msg += f"   {field}: <s>{old_val}</s> → <b>{new_val}</b>\n\n"
+            parts.append(
+                f"<b>{i}. {title}</b>\n"
+                f"   {field}: <s>{old_val}</s> → <b>{new_val}</b>\n\n"
+            )
 
         if len(change_list) > 20:
-            msg += f"... and {len(change_list) - 20} more"
+            parts.append(f"... and {len(change_list) - 20} more")
 
-        self.send_message(chat_id, msg)
+        self.send_message(chat_id, "".join(parts))
 
     def cmd_search(self, chat_id, query):
         """Search properties by keyword."""
@@ -341,17 +397,13 @@ class PropertyBot:
             return
 
         # Sort by price
-        results.sort(key=lambda p: self.parse_price(p.get("price", "")))
-
-        msg = f"🔍 <b>Search: '{self.esc(query)}'</b>\n"
-        msg += f"Found {len(results)} result(s)\n\n"
-
-        for i, prop in enumerate(results[:15], 1):
-            msg += self.format_property(prop, i) + "\n"
-
-        if len(results) > 15:
-            msg += f"\n... and {len(results) - 15} more. Refine your search."
+        results.sort(key=self.property_price)
 
+        msg = self.format_results(
+            f"🔍 <b>Search: '{self.esc(query)}'</b>",
+            results,
+            "Refine your search.",
+        )
         self.send_message(chat_id, msg)
 
     def cmd_type(self, chat_id, ptype):
@@ -385,17 +437,13 @@ class PropertyBot:
             self.send_message(chat_id, f"🔍 No '{self.esc(search_type)}' properties found.")
             return
 
-        results.sort(key=lambda p: self.parse_price(p.get("price", "")))
-
-        msg = f"🏢 <b>{self.esc(search_type)} Properties</b>\n"
-        msg += f"Found {len(results)} result(s)\n\n"
-
-        for i, prop in enumerate(results[:15], 1):
-            msg += self.format_property(prop, i) + "\n"
-
-        if len(results) > 15:
-            msg += f"\n... and {len(results) - 15} more. Use /under or /location to narrow down."
+        results.sort(key=self.property_price)
 
+        msg = self.format_results(
+            f"🏢 <b>{self.esc(search_type)} Properties</b>",
+            results,
+            "Use /under or /location to narrow down.",
+        )
         self.send_message(chat_id, msg)
 
     def cmd_under(self, chat_id, amount_str):
@@ -413,24 +461,20 @@ class PropertyBot:
 
         results = [
             prop for prop in self.properties.values()
-            if 0 < self.parse_price(prop.get("price", "")) <= max_price
+            if 0 < self.property_price(prop) <= max_price
         ]
 
-        results.sort(key=lambda p: self.parse_price(p.get("price", "")))
+        results.sort(key=self.property_price)
 
         if not results:
             self.send_message(chat_id, f"🔍 No properties under RM{max_price:,.0f}")
             return
 
-        msg = f"💰 <b>Properties Under RM{max_price:,.0f}</b>\n"
-        msg += f"Found {len(results)} result(s)\n\n"
-
-        for i, prop in enumerate(results[:15], 1):
-            msg += self.format_property(prop, i) + "\n"
-
-        if len(results) > 15:
-            msg += f"\n... and {len(results) - 15} more. Use /search or /type to narrow down."
-
+        msg = self.format_results(
+            f"💰 <b>Properties Under RM{max_price:,.0f}</b>",
+            results,
+            "Use /search or /type to narrow down.",
+        )
         self.send_message(chat_id, msg)
 
     def cmd_above(self, chat_id, amount_str):
@@ -448,24 +492,20 @@ class PropertyBot:
 
         results = [
             prop for prop in self.properties.values()
-            if self.parse_price(prop.get("price", "")) >= min_price
+            if self.property_price(prop) >= min_price
         ]
 
-        results.sort(key=lambda p: self.parse_price(p.get("price", "")))
+        results.sort(key=self.property_price)
 
         if not results:
             self.send_message(chat_id, f"🔍 No properties above RM{min_price:,.0f}")
             return
 
-        msg = f"💰 <b>Properties Above RM{min_price:,.0f}</b>\n"
-        msg += f"Found {len(results)} result(s)\n\n"
-
-        for i, prop in enumerate(results[:15], 1):
-            msg += self.format_property(prop, i) + "\n"
-
-        if len(results) > 15:
-            msg += f"\n... and {len(results) - 15} more. Use /search or /type to narrow down."
-
+        msg = self.format_results(
+            f"💰 <b>Properties Above RM{min_price:,.0f}</b>",
+            results,
+            "Use /search or /type to narrow down.",
+        )
         self.send_message(chat_id, msg)
 
     def cmd_location(self, chat_id, area):
@@ -480,52 +520,45 @@ class PropertyBot:
             if area_lower in prop.get("location", "").lower()
         ]
 
-        results.sort(key=lambda p: self.parse_price(p.get("price", "")))
+        results.sort(key=self.property_price)
 
         if not results:
             self.send_message(chat_id, f"🔍 No properties found in '{self.esc(area)}'")
             return
 
-        msg = f"📍 <b>Properties in '{self.esc(area)}'</b>\n"
-        msg += f"Found {len(results)} result(s)\n\n"
-
-        for i, prop in enumerate(results[:15], 1):
-            msg += self.format_property(prop, i) + "\n"
-
-        if len(results) > 15:
-            msg += f"\n... and {len(results) - 15} more. Use /under or /type to narrow down."
-
+        msg = self.format_results(
+            f"📍 <b>Properties in '{self.esc(area)}'</b>",
+            results,
+            "Use /under or /type to narrow down.",
+        )
         self.send_message(chat_id, msg)
 
     def cmd_summary(self, chat_id):
         """Show market summary by property type."""
-        type_stats = {}
+        # Gather prices per type, then reduce each list with sum/min/max
+        type_counts = Counter()
+        type_prices = defaultdict(list)
         for prop in self.properties.values():
             ptype = prop.get("property_type", "Other")
-            price = self.parse_price(prop.get("price", ""))
-            if ptype not in type_stats:
-                type_stats[ptype] = {"count": 0, "total_price": 0, "min": float("inf"), "max": 0}
-            type_stats[ptype]["count"] += 1
+            type_counts[ptype] += 1
+            price = self.property_price(prop)
             if price > 0:
-                type_stats[ptype]["total_price"] += price
-                type_stats[ptype]["min"] = min(type_stats[ptype]["min"], price)
-                type_stats[ptype]["max"] = max(type_stats[ptype]["max"], price)
+                type_prices[ptype].append(price)
 
-        msg = "📊 <b>Market Summary</b>\n"
-        msg += f"Total: {len(self.properties):,} properties\n\n"
+        parts = ["📊 <b>Market Summary</b>\n", f"Total: {len(self.properties):,} properties\n\n"]
 
-        for ptype, stats in sorted(type_stats.items(), key=lambda x: -x[1]["count"]):
-            count = stats["count"]
-            avg = stats["total_price"] / count if count > 0 and stats["total_price"] > 0 else 0
-            min_p = stats["min"] if stats["min"] != float("inf") else 0
-            max_p = stats["max"]
+        for ptype, count in type_counts.most_common():
+            prices = type_prices.get(ptype)
 
-            msg += f"<b>{self.esc(ptype)}</b> ({count})\n"
-            if avg > 0:
-                msg += f"   Avg: RM{avg:,.0f} | Range: RM{min_p:,.0f} - RM{max_p:,.0f}\n"
-            msg += "\n"
+            parts.append(f"<b>{self.esc(ptype)}</b> ({count})\n")
+            if prices:
+                avg = sum(prices) / count
+                parts.append(
+                    f"   Avg: RM{avg:,.0f} | Range: RM{min(prices):,.0f} - RM{max(prices):,.0f}\n"
+                )
+            parts.append("\n")
 
-        self.send_message(chat_id, msg)
+        self.send_message(chat_id, "".join(parts))
 
     def maybe_refresh(self):
         """Refresh data from GitHub if enough time has passed."""
@@ -586,7 +619,7 @@ class PropertyBot:
             try:
                 self.maybe_refresh()
 
-                resp = requests.get(
+                resp = self.session.get(
                     f"{self.api_url}/getUpdates",
                     params={"offset": self.last_update_id + 1, "timeout": 30},
                     timeout=35,
@@ -609,6 +642,7 @@ class PropertyBot:
                 time.sleep(5)
             except KeyboardInterrupt:
                 print("\nBot stopped.")
+                self.session.close()
                 break
             except Exception as e:
                 print(f"Error: {e}")
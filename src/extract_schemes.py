@@ -120,9 +120,8 @@ def main():
 
         if total_processed % 200 == 0 or batch_start + BATCH_SIZE >= len(uncached):
             print(f"  Progress: {total_processed}/{len(uncached)}")
-            save_cache(cache)
+            save_cache(cache)  # the last batch always saves
 
-    save_cache(cache)
     named = sum(1 for v in cache.values() if v)
     print(f"  Scheme extraction complete: {named} named, {len(cache) - named} unnamed")
 
@@ -63,18 +63,6 @@ def parse_auction_date(ad_str):
     return None
 
 
-def get_active_properties(properties):
-    """Filter to only active listings (future auction dates)."""
-    now = datetime.now()
-    active = {}
-    for pid, p in properties.items():
-        ad = p.get("auction_date", "")
-        d = parse_auction_date(ad)
-        if d and d >= now:
-            active[pid] = p
-    return active
-
-
 def extract_price_value(price_str):
     """Extract numeric value from a price string like 'RM1,234,000'."""
     m = re.search(r"[\d,]+", str(price_str))
@@ -235,18 +223,28 @@ def write_data_files(properties, changes_history, daily_stats):
         with open(scheme_cache_path, "r") as f:
             scheme_cache = json.load(f)
 
-    active = get_active_properties(properties)
-
-    # active.json - trimmed ALL listings (active + expired for search)
+    # active.json - trimmed ALL listings (active + expired for search).
+    # Single pass: each auction date is parsed once and decides both whether
+    # the listing is active (future auction) and whether it is marked expired;
+    # filter options are collected from the trimmed records along the way.
+    now = datetime.now()
+    active = {}
     active_data = {}
+    types_set = set()
+    locs_set = set()
     for pid, p in properties.items():
         trimmed = trim_property(p, geocode_cache, scheme_cache)
-        # Mark expired listings
-        ad = p.get("auction_date", "")
-        d = parse_auction_date(ad)
-        if d and d < datetime.now():
-            trimmed["exp"] = 1
+        d = parse_auction_date(p.get("auction_date", ""))
+        if d:
+            if d >= now:
+                active[pid] = p
+            else:
+                trimmed["exp"] = 1
         active_data[pid] = trimmed
+        if trimmed.get("pt"):
+            types_set.add(trimmed["pt"])
+        if trimmed.get("l"):
+            locs_set.add(trimmed["l"])
 
     with open(os.path.join(data_dir, "active.json"), "w") as f:
         json.dump(active_data, f, separators=(",", ":"))
@@ -278,15 +276,6 @@ def write_data_files(properties, changes_history, daily_stats):
     # Count properties with price drops
     drop_count = sum(1 for p in active.values() if p.get("discount"))
 
-    # Collect unique types and locations for filters (from all properties)
-    types_set = set()
-    locs_set = set()
-    for p in active_data.values():
-        if p.get("pt"):
-            types_set.add(p["pt"])
-        if p.get("l"):
-            locs_set.add(p["l"])
-
     stats_data = {
         "total_tracked": len(properties),
         "active_count": len(active),
@@ -102,7 +102,6 @@ def main():
 
     if not uncached:
         print("  All addresses already geocoded (cache hit)")
-        save_cache(cache)
         return
 
     print(f"  Need to geocode: {len(uncached)} new addresses")
@@ -122,9 +121,8 @@ def main():
 
         if (i + 1) % 50 == 0 or i == len(uncached) - 1:
             print(f"  Progress: {i+1}/{len(uncached)} ({success} ok, {failed} default)")
-            save_cache(cache)  # Save periodically
+            save_cache(cache)  # Save periodically; the last address always saves
 
-    save_cache(cache)
     print(f"  Geocoding complete: {success} resolved, {failed} defaulted")
 
 
@@ -19,11 +19,14 @@ from pathlib import Path
 
 DATA_DIR = Path(os.path.dirname(__file__)).parent / "data"
 
+_WS_RE = re.compile(r"\s+")
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+
 
 def normalize_text(s):
     if not s:
         return ""
-    return re.sub(r"\s+", " ", s.strip().lower())
+    return _WS_RE.sub(" ", s.strip().lower())
 
 
 def normalize_size(s):
@@ -160,11 +163,12 @@ def pick_best_entry(entries):
 
 def create_property_id(prop):
     """Create a clean, stable property ID."""
-    title = re.sub(r"[^\w\s]", "", prop.get("title", ""))
-    location = re.sub(r"[^\w\s]", "", prop.get("location", ""))
-    size = re.sub(r"[^\w\s]", "", prop.get("size", ""))
-    base = f"{title}_{location}_{size}".strip()
-    base = re.sub(r"\s+", "_", base).lower()
+    # Stripping punctuation is per character, so one pass over the joined
+    # fields gives the same result as cleaning each field separately
+    base = _NON_WORD_RE.sub(
+        "", f"{prop.get('title', '')}_{prop.get('location', '')}_{prop.get('size', '')}"
+    ).strip()
+    base = _WS_RE.sub("_", base).lower()
     if not base or base == "__":
         base = "property"
     return base[:120]
@@ -370,8 +374,9 @@ def group_properties(input_path=None, output_path=None):
     print(f"RESULT: {len(database)} unique properties")
     print(f"  From listing_id+size groups: {total_lid}")
     print(f"  From stable_key groups: {total_sk}")
+    reduction_pct = 100.0 - 100.0 * len(database) / len(raw) if raw else 0.0
     print(f"  Reduction: {len(raw)} -> {len(database)} "
-          f"({100 - len(database) / len(raw) * 100:.1f}% reduction)")
+          f"({reduction_pct:.1f}% reduction)")
 
     now = datetime.now()
     active = sum(
@@ -6,10 +6,11 @@ Improved property identification and validation
 """
 
 import requests
-from bs4 import BeautifulSoup
-import json
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 import time
 import os
+import sys
 from datetime import datetime, timedelta
 import re
 import tempfile
@@ -17,6 +18,148 @@ from pathlib import Path
 import urllib.parse
 import hashlib
 import html  # for Telegram HTML escaping
+from itertools import islice
+from collections import Counter
+
+from reprocess import _json_bytes, _json_loads, reprocess_all
+
+_BAR = "=" * 80
+
+# First number in a price string, e.g. "RM1,234,000.50" -> "1,234,000.50".
+# At most one decimal point is matched, so float() always accepts it
+_PRICE_RE = re.compile(r"(\d[\d,]*(?:\.\d+)?)")
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_WS_RE = re.compile(r"\s+")
+_RESULT_RE = re.compile(r"Result\(s\):\s*([\d,]+)")
+# Same count in raw markup, where the gap may be written as an nbsp entity
+_RESULT_RAW_RE = re.compile(
+    r"Result\(s\):(?:\s|&nbsp;|&#160;|&#[xX][aA]0;)*([\d,]+)"
+)
+_PAGE_NUM_RE = re.compile(r"page=(\d+)")
+_DIGITS_RE = re.compile(r"\d+")
+
+# Listing card links on a search results page
+_PROPERTY_HREF_RE = re.compile(r"/property/")
+_STRETCHED_LINK_RE = re.compile(r"stretched-link")
+
+# Card header/address tags and the placeholder text around them
+_TEXT_MUTED_RE = re.compile(r"text-muted", re.IGNORECASE)
+_FW_BOLD_RE = re.compile(r"fw-bold", re.IGNORECASE)
+_LOGIN_TO_VIEW_RE = re.compile(r"\s*Login to view\s*", re.IGNORECASE)
+_UNIT_NO_RE = re.compile(r"^\s*Unit No\.\s*,?\s*", re.IGNORECASE)
+
+# Listing card fields, matched against each container's text
+_RM_AMOUNT_RE = re.compile(r"RM([\d,]+)")
+_AUCTION_DATE_RE = re.compile(r"\d{1,2}\s+\w{3}\s+\d{4}\s+\(\w{3}\)")
+_DAY_SUFFIX_RE = re.compile(r"\s*\(\w{3}\)")
+_RM_PRICE_RE = re.compile(r"RM[\d,]+")
+_SIZE_RE = re.compile(r"([\d,]+\s*sq\.ft)")
+_DISCOUNT_RE = re.compile(r"(-\d+%)")
+_STOREY_SHOP_RE = re.compile(r"\d+\s+Storey\s+Shop\s+Office", re.IGNORECASE)
+
+# Fallback title and location patterns, tried in order (first hit wins)
+_TITLE_PATTERNS = tuple(
+    re.compile(p)
+    for p in (
+        r"([A-Z][a-zA-Z\s&]+(?:Office|Tower|Plaza|Centre|Center|Complex|Building|Mall|Square))",
+        r"([A-Z][a-zA-Z\s&]+(?:Apartment|Condominium|Residence|Suites|Condo))",
+        r"([A-Z][a-zA-Z\s&]+(?:Shop|Retail|Commercial|Store))",
+        r"([A-Z][a-zA-Z\s&]+(?:Factory|Warehouse|Industrial|Plant))",
+        r"([A-Z][a-zA-Z\s&,]+(?:Land|Plot|Lot))",
+        r"(Taman\s+[A-Z][a-zA-Z\s&]+)",
+        r"(Bandar\s+[A-Z][a-zA-Z\s&]+)",
+        r"(Menara\s+[A-Z][a-zA-Z\s&]+)",
+    )
+)
+_LOCATION_PATTERNS = tuple(
+    re.compile(rf"({area}[^,\n.]*)")
+    for area in (
+        "Kuala Lumpur", "Selangor", "Shah Alam", "Petaling Jaya", "Subang",
+        "Klang", "Cyberjaya", "Kota Damansara", "Mont Kiara", "Bangsar",
+        "Kajang", "Puchong", "Ampang", "Cheras",
+    )
+)
+
+# BeautifulSoup tree builder for every page we parse (libxml2, C)
+_HTML_PARSER = "lxml"
+
+# Telegram card icon per change type
+_CHANGE_ICONS = {"price_change": "💰", "auction_date_change": "📅"}
+
+
+def _iter_message_parts(text, max_length):
+    """Yield pieces of text no longer than max_length, cut at the last newline
+    in each window (or hard at max_length if there is none). Newlines at a cut
+    are dropped. Walks the string by index rather than re-slicing the rest.
+
+    Duplicated in bot.py (the bot stays importable without the scraper's
+    dependencies); keep the two copies in sync."""
+    start = 0
+    end = len(text)
+    while end - start > max_length:
+        split_at = text.rfind("\n", start, start + max_length)
+        if split_at == -1:
+            split_at = start + max_length
+        yield text[start:split_at]
+        start = split_at
+        while start < end and text[start] == "\n":
+            start += 1
+    yield text[start:]
+
+
+def _writable_dir(path):
+    """Create path if needed and check a file can be written in it."""
+    try:
+        path.mkdir(exist_ok=True)
+        probe = path / ".probe"
+        probe.write_bytes(b"")
+        probe.unlink()
+        return True
+    except OSError:
+        return False
+
+
+def _write_atomic(path, payload):
+    """Write bytes to a sibling temp file, fsync it, then rename it over
+    path, so a crash mid-write leaves the previous file intact."""
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        # Don't leave a partial .tmp behind for the workflow to commit
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# categorize_property_type rules. Each category's keyword patterns are
+# OR-ed into one regex, so a title is scanned once per category
+_BRACKETED_RE = re.compile(r"\[.*?\]", re.DOTALL)
+_LANDED_RE = re.compile(
+    r"(semi.?detached|detached)\s*(house|home|plot|lot)"
+    r"|bungalow"
+    r"|terrace\s*house"
+    r"|cluster\s*(semi|house|design)"
+    r"|link\s*(semi|house|bungalow)"
+    r"|town\s*(house|villa)"
+    r"|villa\b"
+    r"|\d+\.?\d*\s*storey\s*(semi|detached|cluster|link|zero)"
+    r"|(detached|semi|terrace|house|bungalow)\s*(plot|lot)\b"
+    r"|residential\s*(lot|plot|building|terrace)"
+    r"|vacant\s*(semi|detached|residential|terrace)"
+    r"|housing\s*(lot|plot|land)"
+)
+_HIGH_RISE_RE = re.compile(
+    r"apartment|condominium|condo\b|flat\b|penthouse|service\s+suite|\bsoho\b"
+)
+_RESIDENTIAL_RE = re.compile(r"resid(ential|ence)")
+_INDUSTRIAL_RE = re.compile(r"factory|warehouse|industrial")
+_LAND_RE = re.compile(
+    r"\bland\b|vacant\s*(plot|lot|building)|parcels?\s+of|residential\s*land"
+)
 
 
 def categorize_property_type(title):
@@ -27,81 +170,30 @@ def categorize_property_type(title):
     This function derives the correct category from the actual property title,
     which describes the physical property type (e.g. "2 Storey Semi Detached House").
     """
-    t = re.sub(r"\[.*?\]", "", title, flags=re.DOTALL).strip().lower()
+    t = _BRACKETED_RE.sub("", title).strip().lower()
 
     # ── Landed Residential ──────────────────────────────────────
-    if re.search(r"(semi.?detached|detached)\s*(house|home|plot|lot)", t):
-        return "Landed"
-    if re.search(r"bungalow", t):
-        return "Landed"
-    if re.search(r"terrace\s*house", t):
-        return "Landed"
-    if re.search(r"cluster\s*(semi|house|design)", t):
-        return "Landed"
-    if re.search(r"link\s*(semi|house|bungalow)", t):
-        return "Landed"
-    if re.search(r"town\s*(house|villa)", t):
-        return "Landed"
-    if re.search(r"villa\b", t):
-        return "Landed"
-    if re.search(r"\d+\.?\d*\s*storey\s*(semi|detached|cluster|link|zero)", t):
-        return "Landed"
-    if t.rstrip().endswith("house") or t.rstrip().endswith("houses"):
-        return "Landed"
-    if re.search(r"(detached|semi|terrace|house|bungalow)\s*(plot|lot)\b", t):
-        return "Landed"
-    if re.search(r"residential\s*(lot|plot|building|terrace)", t):
-        return "Landed"
-    if re.search(r"vacant\s*(semi|detached|residential|terrace)", t):
-        return "Landed"
-    if re.search(r"housing\s*(lot|plot|land)", t):
+    if _LANDED_RE.search(t) or t.endswith(("house", "houses")):
         return "Landed"
 
     # ── High-rise Residential ───────────────────────────────────
-    if re.search(
-        r"apartment|condominium|condo\b|flat\b|penthouse|service\s+suite", t
-    ):
-        return "High-rise"
-    if re.search(r"\bsoho\b", t):
+    if _HIGH_RISE_RE.search(t):
         return "High-rise"
-    if re.search(r"residence\b", t) and "land" not in t:
-        return "High-rise"
-    if re.search(r"resid(ential|ence)", t) and "land" not in t:
+    if _RESIDENTIAL_RE.search(t) and "land" not in t:
         return "High-rise"
 
     # ── Industrial (before Commercial — factories have "shop" in address) ─
-    if re.search(r"factory|warehouse|industrial", t):
+    if _INDUSTRIAL_RE.search(t):
         return "Industrial"
 
     # ── Land ────────────────────────────────────────────────────
-    if re.search(r"\bland\b", t):
-        return "Land"
-    if re.search(r"vacant\s*(plot|lot|building)", t):
-        return "Land"
-    if re.search(r"parcels?\s+of", t):
-        return "Land"
-    if re.search(r"residential\s*land", t):
+    if _LAND_RE.search(t):
         return "Land"
 
     # ── Commercial ──────────────────────────────────────────────
-    if re.search(r"shop", t):
-        return "Commercial"
-    if re.search(r"office|sofo|sovo|business\s*(suite|centre|center)", t):
-        return "Commercial"
-    if re.search(r"retail", t):
-        return "Commercial"
-    if re.search(r"hotel", t):
-        return "Commercial"
-    if re.search(r"commercial", t):
-        return "Commercial"
-    if re.search(r"(mall|plaza|complex|square|kiosk)\b", t):
-        return "Commercial"
-    if re.search(r"strata|stratified", t):
-        return "Commercial"
-    if re.search(r"convention\s*hall", t):
-        return "Commercial"
-
-    return "Commercial"  # default fallback
+    # Shops, offices (sofo/sovo, business suites), retail, hotels, malls,
+    # plazas, kiosks, strata units, convention halls — and anything else
+    return "Commercial"
 
 
 class FixedFullScrapingPropertyMonitor:
@@ -117,13 +209,18 @@ class FixedFullScrapingPropertyMonitor:
         )
         self.data_path = self.base_path / "data"
 
-        # Create data directory if possible, otherwise use temp
-        try:
-            self.data_path.mkdir(exist_ok=True)
+        # Create data directory if possible and check it is writable,
+        # otherwise use temp (the runner's scratch dir on GitHub Actions)
+        if _writable_dir(self.data_path):
             self.use_persistent_storage = True
             print(f"📁 Using persistent storage: {self.data_path}")
-        except Exception:
-            self.data_path = Path(tempfile.mkdtemp())
+        else:
+            runner_temp = os.getenv("RUNNER_TEMP")
+            scratch = Path(runner_temp) / "lelongtips" if runner_temp else None
+            if scratch is not None and _writable_dir(scratch):
+                self.data_path = scratch
+            else:
+                self.data_path = Path(tempfile.mkdtemp())
             self.use_persistent_storage = False
             print(f"📁 Using temporary storage: {self.data_path}")
 
@@ -166,9 +263,13 @@ class FixedFullScrapingPropertyMonitor:
             "Pragma": "no-cache",
         }
 
-        # Session for authenticated scraping (persists cookies)
+        # Shared session for scraping and Telegram: persists login cookies and
+        # keeps connections alive between requests
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        )
         self.logged_in = False
 
         # Rate limiting settings
@@ -176,6 +277,15 @@ class FixedFullScrapingPropertyMonitor:
         self.max_retries = 3
         self.timeout = 30
 
+        # Upper bound on pages when the count has to be estimated from the
+        # result total (no pagination links); override with MAX_PAGES.
+        # Empty or non-numeric values (e.g. an unset workflow input) keep 600
+        try:
+            max_pages = int(os.environ.get("MAX_PAGES", "600"))
+        except ValueError:
+            max_pages = 600
+        self.max_pages = max(1, max_pages)
+
         # Validation settings
         self.min_price = 50000  # Minimum valid price RM50,000
         self.max_price = 500000000  # Maximum valid price RM500M
@@ -183,9 +293,18 @@ class FixedFullScrapingPropertyMonitor:
         # Duplicate detection (within a run)
         self.seen_property_hashes = set()
 
+        # Page 1 response fetched for the totals, reused by the scrape loop
+        self._first_page_response = None
+
+        # Timestamp shared by every property extracted in the current scan
+        self.scan_timestamp = None
+
         # Notification settings
         self.telegram_bot_token = os.getenv("TELEGRAM_BOT_TOKEN", "")
         self.telegram_chat_id = os.getenv("TELEGRAM_CHAT_ID", "")
+        self.telegram_url = (
+            f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
+        )
 
         print("🚀 Fixed Full Scraping Property Monitor - Eliminates Over-Extraction")
         print(
@@ -197,6 +316,10 @@ class FixedFullScrapingPropertyMonitor:
         print(f"💰 Price validation: RM{self.min_price:,} - RM{self.max_price:,}")
 
     # ---------- Utility ----------
+    def close(self):
+        """Release pooled HTTP connections."""
+        self.session.close()
+
     def tg_escape_html(self, text):
         """Escape text for Telegram HTML parse_mode."""
         return html.escape(str(text), quote=True)
@@ -205,7 +328,7 @@ class FixedFullScrapingPropertyMonitor:
         if not s:
             return ""
         s = s.strip().lower()
-        s = re.sub(r"\s+", " ", s)
+        s = _WS_RE.sub(" ", s)
         return s
 
     def normalize_size(self, s):
@@ -213,7 +336,7 @@ class FixedFullScrapingPropertyMonitor:
             return ""
         s = s.lower()
         # extract digits
-        digits = re.findall(r"\d+", s)
+        digits = _DIGITS_RE.findall(s)
         num = "".join(digits) if digits else ""
         # keep unit rough
         unit = "sqft" if "sq.ft" in s or "sqft" in s else ""
@@ -238,8 +361,8 @@ class FixedFullScrapingPropertyMonitor:
         """Load the properties database"""
         if self.properties_database.exists():
             try:
-                with open(self.properties_database, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                raw = self.properties_database.read_bytes()
+                return _json_loads(raw)
             except Exception as e:
                 print(f"⚠️ Error loading properties database: {e}")
         return {}
@@ -247,8 +370,7 @@ class FixedFullScrapingPropertyMonitor:
     def save_properties_database(self, database):
         """Save the properties database"""
         try:
-            with open(self.properties_database, "w", encoding="utf-8") as f:
-                json.dump(database, f, indent=2, ensure_ascii=False)
+            _write_atomic(self.properties_database, _json_bytes(database))
             print(f"💾 Properties database saved: {len(database)} properties")
             return True
         except Exception as e:
@@ -258,25 +380,24 @@ class FixedFullScrapingPropertyMonitor:
     def save_scraping_progress(self, progress_data):
         """Save scraping progress for monitoring"""
         try:
-            with open(self.scraping_progress, "w", encoding="utf-8") as f:
-                json.dump(progress_data, f, indent=2)
+            self.scraping_progress.write_bytes(_json_bytes(progress_data))
             return True
         except Exception as e:
             print(f"⚠️ Could not save scraping progress: {e}")
             return False
 
-    def save_changes_history(self, new_listings, changed_properties):
+    def save_changes_history(self, new_listings, changed_properties, scan_ts=None):
         """Save changes history for tracking over time"""
         try:
             existing = []
             if self.changes_history.exists():
-                with open(self.changes_history, "r", encoding="utf-8") as f:
-                    existing = json.load(f)
-                    if not isinstance(existing, list):
-                        existing = []
+                raw = self.changes_history.read_bytes()
+                existing = _json_loads(raw)
+                if not isinstance(existing, list):
+                    existing = []
 
             entry = {
-                "scan_date": datetime.now().isoformat(),
+                "scan_date": scan_ts or datetime.now().isoformat(),
                 "new_listings_count": len(new_listings),
                 "changed_properties_count": len(changed_properties),
                 "new_listing_ids": list(new_listings.keys()),
@@ -299,26 +420,26 @@ class FixedFullScrapingPropertyMonitor:
 
             existing.append(entry)
 
-            with open(self.changes_history, "w", encoding="utf-8") as f:
-                json.dump(existing, f, indent=2, ensure_ascii=False)
+            _write_atomic(self.changes_history, _json_bytes(existing))
             print(f"💾 Changes history saved: {len(entry['changes'])} changes recorded")
             return True
         except Exception as e:
             print(f"⚠️ Could not save changes history: {e}")
             return False
 
-    def save_daily_stats(self, current_properties, new_listings, changed_properties, total_tracked):
+    def save_daily_stats(
+        self, current_properties, new_listings, changed_properties, total_tracked, scan_ts=None
+    ):
         """Save scan statistics"""
         try:
             stats = {
-                "date": datetime.now().isoformat(),
+                "date": scan_ts or datetime.now().isoformat(),
                 "total_listings": len(current_properties),
                 "total_tracked": total_tracked,
                 "new_listings": len(new_listings),
                 "changed_properties": len(changed_properties),
             }
-            with open(self.daily_stats, "w", encoding="utf-8") as f:
-                json.dump(stats, f, indent=2)
+            self.daily_stats.write_bytes(_json_bytes(stats))
             print(f"💾 Scan stats saved")
             return True
         except Exception as e:
@@ -341,14 +462,12 @@ class FixedFullScrapingPropertyMonitor:
 
         IMPORTANT: does NOT include price or auction_date, so a price change
         does not create a "new" property. We rely on title+location+size+address.
+        Must stay in step with reprocess.create_property_id.
         """
-        clean_title = re.sub(r"[^\w\s]", "", title)
-        clean_location = re.sub(r"[^\w\s]", "", location)
-        clean_size = re.sub(r"[^\w\s]", "", size)
-        clean_address = re.sub(r"[^\w\s]", "", address or "")
-
-        base = f"{clean_title}_{clean_location}_{clean_size}_{clean_address}".strip()
-        base = re.sub(r"\s+", "_", base).lower()
+        # Punctuation removal is per character, so cleaning the joined fields
+        # once equals cleaning each field and then joining
+        base = _NON_WORD_RE.sub("", f"{title}_{location}_{size}_{address or ''}").strip()
+        base = _WS_RE.sub("_", base).lower()
         if not base:
             base = "property"
         return base[:150]
@@ -356,21 +475,18 @@ class FixedFullScrapingPropertyMonitor:
     # ---------- Validation ----------
     def validate_price(self, price_str):
         """Validate if price is reasonable for property auction"""
-        try:
-            price_clean = re.sub(r"[^\d.]", "", price_str)
-            if not price_clean:
-                return False, 0
+        price_match = _PRICE_RE.search(price_str or "")
+        if not price_match:
+            return False, 0
 
-            price = float(price_clean)
-            if price < 1000:
-                price *= 1000  # Convert to full amount
+        price = float(price_match.group(1).replace(",", ""))
+        if price < 1000:
+            price *= 1000  # Convert to full amount
 
-            if self.min_price <= price <= self.max_price:
-                return True, int(price)
-            else:
-                return False, int(price)
-        except Exception:
-            return False, 0
+        if self.min_price <= price <= self.max_price:
+            return True, int(price)
+        else:
+            return False, int(price)
 
     def validate_auction_date(self, date_str):
         """Validate if auction date is reasonable.
@@ -378,7 +494,7 @@ class FixedFullScrapingPropertyMonitor:
         In normal mode, only accept future/current auction dates.
         """
         try:
-            if not re.match(r"\d{1,2}\s+\w{3}\s+\d{4}\s+\(\w{3}\)", date_str):
+            if not _AUCTION_DATE_RE.match(date_str):
                 return False
 
             if self.include_expired:
@@ -386,7 +502,7 @@ class FixedFullScrapingPropertyMonitor:
                 return True
 
             # Normal mode: accept only upcoming or current-year auctions
-            date_no_day = re.sub(r"\s*\(\w{3}\)", "", date_str).strip()
+            date_no_day = _DAY_SUFFIX_RE.sub("", date_str).strip()
             try:
                 auction_dt = datetime.strptime(date_no_day, "%d %b %Y")
                 # Accept if auction date is today or in the future
@@ -484,7 +600,7 @@ class FixedFullScrapingPropertyMonitor:
         login_url = f"{self.root_url}/login"
         try:
             resp = self.session.get(login_url, timeout=self.timeout)
-            soup = BeautifulSoup(resp.content, "html.parser")
+            soup = BeautifulSoup(resp.content, _HTML_PARSER)
             csrf_input = soup.find("input", {"name": "_token"})
             token = csrf_input["value"] if csrf_input else ""
 
@@ -541,7 +657,7 @@ class FixedFullScrapingPropertyMonitor:
                 return self.make_request(url, params, retry_count + 1)
             else:
                 print(f"❌ Request failed after {self.max_retries + 1} attempts: {e}")
-                raise e
+                raise
 
     def get_total_pages_and_results(self):
         """Get total number of pages and results from first page"""
@@ -549,22 +665,42 @@ class FixedFullScrapingPropertyMonitor:
 
         try:
             response = self.make_request(self.base_url, self.search_params)
-            soup = BeautifulSoup(response.content, "html.parser")
+            self._first_page_response = response
+            # Shows whether the site negotiated br (needs brotli installed)
+            print(
+                f"🗜️ Content-Encoding: {response.headers.get('Content-Encoding', 'none')}"
+            )
 
+            # The count sits in plain text, so search the decoded page directly
+            # rather than walking every string node of the parsed tree. If the
+            # markup hides it (e.g. some other entity), fall back to the
+            # parsed text nodes
             total_results = 0
-            result_text = soup.find(string=re.compile(r"Result\(s\):\s*[\d,]+"))
-            if result_text:
-                result_match = re.search(r"Result\(s\):\s*([\d,]+)", result_text)
-                if result_match:
-                    total_results = int(result_match.group(1).replace(",", ""))
+            result_match = _RESULT_RAW_RE.search(response.text)
+            if not result_match:
+                result_text = BeautifulSoup(response.content, _HTML_PARSER).find(
+                    string=_RESULT_RE
+                )
+                if result_text:
+                    result_match = _RESULT_RE.search(result_text)
+            if result_match:
+                total_results = int(result_match.group(1).replace(",", ""))
+
+            # Only the pagination links are needed here; the strainer keeps
+            # every other element out of the tree (page 1's listings are
+            # parsed separately by extract_properties_from_page)
+            pagination_links = BeautifulSoup(
+                response.content,
+                _HTML_PARSER,
+                parse_only=SoupStrainer("a", href=_PAGE_NUM_RE),
+            ).find_all("a")
 
             total_pages = 1
-            pagination_links = soup.find_all("a", href=re.compile(r"page=\d+"))
             page_numbers = []
 
             for link in pagination_links:
                 href = link.get("href", "")
-                page_match = re.search(r"page=(\d+)", href)
+                page_match = _PAGE_NUM_RE.search(href)
                 if page_match:
                     page_num = int(page_match.group(1))
                     page_numbers.append(page_num)
@@ -574,7 +710,7 @@ class FixedFullScrapingPropertyMonitor:
             else:
                 # 12 listings per page
                 if total_results > 12:
-                    total_pages = min((total_results + 11) // 12, 600)
+                    total_pages = min((total_results + 11) // 12, self.max_pages)
 
             print(f"📊 Found {total_results:,} total results across {total_pages} pages")
             return total_results, total_pages
@@ -584,25 +720,30 @@ class FixedFullScrapingPropertyMonitor:
             return 7000, 590  # Fallback (~7000 listings, 12 per page)
 
     # ---------- Extraction ----------
-    def extract_properties_from_page(self, page_content, page_num):
-        """Extract property data from a single page with improved validation"""
+    def extract_properties_from_page(self, page_content, page_num, encoding=None):
+        """Extract property data from a single page with improved validation.
+
+        page_content may be raw bytes, in which case `encoding` (usually the
+        response's header charset) tells the parser how to decode them.
+        """
         properties = []
         page_duplicates = 0
         page_invalid = 0
 
         try:
-            soup = BeautifulSoup(page_content, "html.parser")
+            soup = BeautifulSoup(page_content, _HTML_PARSER, from_encoding=encoding)
             potential_properties = []
 
             # Strategy 1: find listing cards via /property/ links with stretched-link
             # Each listing card has exactly one <a class="stretched-link" href="/property/...">
             property_links = soup.find_all(
                 "a",
-                href=re.compile(r"/property/"),
-                class_=re.compile(r"stretched-link"),
+                href=_PROPERTY_HREF_RE,
+                class_=_STRETCHED_LINK_RE,
             )
 
             seen_containers = set()  # track by element id to avoid duplicates
+            seen_hashes = set()  # container text hashes already queued
             for link in property_links:
                 try:
                     container = link.parent
@@ -611,18 +752,17 @@ class FixedFullScrapingPropertyMonitor:
                     while container and container.name != "html" and container_attempts < 6:
                         container_text = container.get_text()
 
-                        has_price = bool(re.search(r"RM[\d,]+", container_text))
-                        has_date = bool(
-                            re.search(
-                                r"\d{1,2}\s+\w{3}\s+\d{4}\s+\(\w{3}\)", container_text
-                            )
-                        )
+                        # One lazy scan for prices: the first match answers
+                        # has_price, the next two (if needed) the size check below
+                        prices = _RM_PRICE_RE.finditer(container_text)
+                        has_price = next(prices, None) is not None
+                        has_date = bool(_AUCTION_DATE_RE.search(container_text))
 
                         if has_price and has_date:
                             # Prefer smallest container: check it doesn't contain
-                            # multiple prices (which would mean it wraps several cards)
-                            price_count = len(re.findall(r"RM[\d,]+", container_text))
-                            if price_count > 2:
+                            # more than two prices (which would mean it wraps
+                            # several cards). Stops scanning at the third
+                            if next(prices, None) and next(prices, None):
                                 # Container too large (multiple listings), keep walking
                                 container = container.parent
                                 container_attempts += 1
@@ -635,9 +775,8 @@ class FixedFullScrapingPropertyMonitor:
                                 container_hash = hashlib.md5(
                                     container_text.encode()
                                 ).hexdigest()
-                                if container_hash not in [
-                                    p.get("container_hash") for p in potential_properties
-                                ]:
+                                if container_hash not in seen_hashes:
+                                    seen_hashes.add(container_hash)
                                     potential_properties.append(
                                         {
                                             "container": container,
@@ -654,7 +793,7 @@ class FixedFullScrapingPropertyMonitor:
 
             # Strategy 2 (fallback): walk up from RM price text nodes
             if not potential_properties:
-                price_elements = soup.find_all(string=re.compile(r"RM[\d,]+"))
+                price_elements = soup.find_all(string=_RM_PRICE_RE)
 
                 for price_elem in price_elements:
                     try:
@@ -664,20 +803,15 @@ class FixedFullScrapingPropertyMonitor:
                         while container and container.name != "html" and container_attempts < 10:
                             container_text = container.get_text()
 
-                            has_price = bool(re.search(r"RM[\d,]+", container_text))
-                            has_date = bool(
-                                re.search(
-                                    r"\d{1,2}\s+\w{3}\s+\d{4}\s+\(\w{3}\)", container_text
-                                )
-                            )
+                            has_price = bool(_RM_PRICE_RE.search(container_text))
+                            has_date = bool(_AUCTION_DATE_RE.search(container_text))
 
                             if has_price and has_date:
                                 container_hash = hashlib.md5(
                                     container_text.encode()
                                 ).hexdigest()
-                                if container_hash not in [
-                                    p.get("container_hash") for p in potential_properties
-                                ]:
+                                if container_hash not in seen_hashes:
+                                    seen_hashes.add(container_hash)
                                     potential_properties.append(
                                         {
                                             "container": container,
@@ -692,12 +826,7 @@ class FixedFullScrapingPropertyMonitor:
                     except Exception:
                         continue
 
-            print(
-                f"📄 Page {page_num}: "
-                f"Found {len(potential_properties)} potential property containers"
-            )
-
-            rejection_reasons = {}
+            rejection_reasons = Counter()
             for i, prop_info in enumerate(potential_properties):
                 try:
                     property_data = self.extract_and_validate_property(
@@ -724,10 +853,10 @@ class FixedFullScrapingPropertyMonitor:
                             page_duplicates += 1
                     elif isinstance(property_data, str):
                         # Rejection reason string
-                        rejection_reasons[property_data] = rejection_reasons.get(property_data, 0) + 1
+                        rejection_reasons[property_data] += 1
                         page_invalid += 1
                     else:
-                        rejection_reasons["unknown"] = rejection_reasons.get("unknown", 0) + 1
+                        rejection_reasons["unknown"] += 1
                         page_invalid += 1
                 except Exception as e:
                     print(f"⚠️ Error processing property {i} on page {page_num}: {e}")
@@ -739,8 +868,10 @@ class FixedFullScrapingPropertyMonitor:
                 reason_str = " | rejected: " + ", ".join(
                     f"{k}={v}" for k, v in sorted(rejection_reasons.items())
                 )
+            # One status line per page, covering containers found and kept
             print(
                 f"✅ Page {page_num}: Extracted {len(properties)} valid properties "
+                f"from {len(potential_properties)} containers "
                 f"(skipped {page_duplicates} duplicates, {page_invalid} invalid{reason_str})"
             )
             return properties
@@ -771,9 +902,7 @@ class FixedFullScrapingPropertyMonitor:
                 for node in search_nodes:
                     # Short header, e.g. "Plaza Haji Taib, Kuala Lumpur"
                     if not header_short:
-                        p_tag = node.find(
-                            "p", class_=re.compile(r"text-muted", re.IGNORECASE)
-                        )
+                        p_tag = node.find("p", class_=_TEXT_MUTED_RE)
                         if p_tag:
                             txt = p_tag.get_text(strip=True)
                             if txt:
@@ -781,9 +910,7 @@ class FixedFullScrapingPropertyMonitor:
 
                     # Full address, e.g. "Plaza Haji Taib, 42, Lorong Haji Taib ..."
                     if not header_full:
-                        h5_tag = node.find(
-                            "h5", class_=re.compile(r"fw-bold", re.IGNORECASE)
-                        )
+                        h5_tag = node.find("h5", class_=_FW_BOLD_RE)
                         if h5_tag:
                             txt = h5_tag.get_text(separator=" ", strip=True)
                             if txt:
@@ -791,23 +918,11 @@ class FixedFullScrapingPropertyMonitor:
 
                     # Old layout: Unit No., Jalan Tasik Raja Lumu...
                     if not header_full:
-                        h3_tag = node.find(
-                            "h3", class_=re.compile(r"fw-bold", re.IGNORECASE)
-                        )
+                        h3_tag = node.find("h3", class_=_FW_BOLD_RE)
                         if h3_tag:
                             txt = h3_tag.get_text(separator=" ", strip=True)
-                            txt = re.sub(
-                                r"\s*Login to view\s*",
-                                "",
-                                txt,
-                                flags=re.IGNORECASE,
-                            )
-                            txt = re.sub(
-                                r"^\s*Unit No\.\s*,?\s*",
-                                "",
-                                txt,
-                                flags=re.IGNORECASE,
-                            )
+                            txt = _LOGIN_TO_VIEW_RE.sub("", txt)
+                            txt = _UNIT_NO_RE.sub("", txt)
                             txt = txt.strip(" ,")
                             if txt:
                                 header_full = txt
@@ -885,7 +1000,7 @@ class FixedFullScrapingPropertyMonitor:
                 pass
 
             # ---------- PRICE ----------
-            price_match = re.search(r"RM([\d,]+)", container_text)
+            price_match = _RM_AMOUNT_RE.search(container_text)
             if not price_match:
                 return "no_price"
             price_str = f"RM{price_match.group(1)}"
@@ -896,18 +1011,16 @@ class FixedFullScrapingPropertyMonitor:
             property_data["price_value"] = price_value
 
             # ---------- AUCTION DATE ----------
-            date_match = re.search(
-                r"(\d{1,2}\s+\w{3}\s+\d{4}\s+\(\w{3}\))", container_text
-            )
+            date_match = _AUCTION_DATE_RE.search(container_text)
             if not date_match:
                 return "no_date"
-            auction_date = date_match.group(1)
+            auction_date = date_match.group(0)
             if not self.validate_auction_date(auction_date):
                 return "expired"
             property_data["auction_date"] = auction_date
 
             # ---------- SIZE ----------
-            size_match = re.search(r"([\d,]+\s*sq\.ft)", container_text)
+            size_match = _SIZE_RE.search(container_text)
             if size_match:
                 property_data["size"] = size_match.group(1)
             else:
@@ -919,29 +1032,17 @@ class FixedFullScrapingPropertyMonitor:
                 title = listing_title
             else:
                 # Pattern like "3 Storey Shop Office"
-                m_storey = re.search(
-                    r"\d+\s+Storey\s+Shop\s+Office", container_text, flags=re.IGNORECASE
-                )
+                m_storey = _STOREY_SHOP_RE.search(container_text)
                 if m_storey:
                     title = m_storey.group(0).strip().title()
                 else:
-                    title_patterns = [
-                        r"([A-Z][a-zA-Z\s&]+(?:Office|Tower|Plaza|Centre|Center|Complex|Building|Mall|Square))",
-                        r"([A-Z][a-zA-Z\s&]+(?:Apartment|Condominium|Residence|Suites|Condo))",
-                        r"([A-Z][a-zA-Z\s&]+(?:Shop|Retail|Commercial|Store))",
-                        r"([A-Z][a-zA-Z\s&]+(?:Factory|Warehouse|Industrial|Plant))",
-                        r"([A-Z][a-zA-Z\s&,]+(?:Land|Plot|Lot))",
-                        r"(Taman\s+[A-Z][a-zA-Z\s&]+)",
-                        r"(Bandar\s+[A-Z][a-zA-Z\s&]+)",
-                        r"(Menara\s+[A-Z][a-zA-Z\s&]+)",
-                    ]
-                    for pattern in title_patterns:
-                        title_match = re.search(pattern, container_text)
+                    for pattern in _TITLE_PATTERNS:
+                        title_match = pattern.search(container_text)
                         if title_match:
                             candidate_title = title_match.group(1).strip()
                             if (
                                 5 <= len(candidate_title) <= 100
-                                and not re.match(r"^\d+$", candidate_title)
+                                and not _DIGITS_RE.fullmatch(candidate_title)
                             ):
                                 title = candidate_title
                                 break
@@ -951,25 +1052,9 @@ class FixedFullScrapingPropertyMonitor:
             property_data["title"] = title
 
             # ---------- LOCATION ----------
-            location_patterns = [
-                r"(Kuala Lumpur[^,\n.]*)",
-                r"(Selangor[^,\n.]*)",
-                r"(Shah Alam[^,\n.]*)",
-                r"(Petaling Jaya[^,\n.]*)",
-                r"(Subang[^,\n.]*)",
-                r"(Klang[^,\n.]*)",
-                r"(Cyberjaya[^,\n.]*)",
-                r"(Kota Damansara[^,\n.]*)",
-                r"(Mont Kiara[^,\n.]*)",
-                r"(Bangsar[^,\n.]*)",
-                r"(Kajang[^,\n.]*)",
-                r"(Puchong[^,\n.]*)",
-                r"(Ampang[^,\n.]*)",
-                r"(Cheras[^,\n.]*)",
-            ]
             location = "KL/Selangor"
-            for pattern in location_patterns:
-                location_match = re.search(pattern, container_text)
+            for pattern in _LOCATION_PATTERNS:
+                location_match = pattern.search(container_text)
                 if location_match:
                     candidate_location = location_match.group(1).strip()
                     if len(candidate_location) <= 100:
@@ -981,7 +1066,7 @@ class FixedFullScrapingPropertyMonitor:
             property_data["property_type"] = categorize_property_type(title)
 
             # ---------- DISCOUNT ----------
-            discount_match = re.search(r"(-\d+%)", container_text)
+            discount_match = _DISCOUNT_RE.search(container_text)
             if discount_match:
                 property_data["discount"] = discount_match.group(1)
 
@@ -1037,7 +1122,7 @@ class FixedFullScrapingPropertyMonitor:
 
             property_data["url"] = f"{self.base_url}?page={page_num}"
             property_data["page_number"] = page_num
-            now_iso = datetime.now().isoformat()
+            now_iso = self.scan_timestamp or datetime.now().isoformat()
             property_data["last_updated"] = now_iso
             property_data["first_seen"] = now_iso
 
@@ -1051,14 +1136,17 @@ class FixedFullScrapingPropertyMonitor:
     # ---------- Scraping loop ----------
     def scrape_all_pages(self, total_pages, total_results):
         """Scrape all pages of Lelong results with improved validation"""
+        total_fmt = f"{total_results:,}"
         print(
             f"🚀 Starting fixed full scrape of {total_pages} pages "
-            f"({total_results:,} total listings)"
+            f"({total_fmt} total listings)"
         )
 
         all_properties = {}
+        self.scan_timestamp = datetime.now().isoformat()
+        scan_start = time.monotonic()  # elapsed-time checks without re-parsing start_time
         scraping_stats = {
-            "start_time": datetime.now().isoformat(),
+            "start_time": self.scan_timestamp,
             "total_pages": total_pages,
             "total_results": total_results,
             "pages_completed": 0,
@@ -1078,17 +1166,25 @@ class FixedFullScrapingPropertyMonitor:
                 if page_num > 1:
                     params["page"] = page_num
 
-                response = self.make_request(self.base_url, params)
+                if page_num == 1 and self._first_page_response is not None:
+                    # Same URL and params as the totals request; don't fetch it twice
+                    response = self._first_page_response
+                    self._first_page_response = None
+                else:
+                    response = self.make_request(self.base_url, params)
+                # Hand lxml the raw bytes rather than decoding to str first.
+                # Only pass a charset the server declared: for a bare text/html
+                # requests reports ISO-8859-1, which would override the page's
+                # <meta charset>; with None, bs4 detects it from the document
+                content_type = response.headers.get("Content-Type", "").lower()
+                encoding = response.encoding if "charset=" in content_type else None
                 page_properties = self.extract_properties_from_page(
-                    response.text, page_num
+                    response.content, page_num, encoding
                 )
 
                 # Fetch size from detail page for properties missing it
                 # Budget: skip if we've already spent too long on detail fetches
-                elapsed_total = (
-                    datetime.now()
-                    - datetime.fromisoformat(scraping_stats["start_time"])
-                ).total_seconds()
+                elapsed_total = time.monotonic() - scan_start
                 if elapsed_total < 900:  # only if under 15 min total
                     for prop_data in page_properties:
                         if prop_data.get("size") == "Size not specified":
@@ -1108,10 +1204,11 @@ class FixedFullScrapingPropertyMonitor:
                     prop_data["total_results_on_site"] = total_results
                     all_properties[property_id] = prop_data
 
+                n_props = len(all_properties)
                 scraping_stats["pages_completed"] = page_num
-                scraping_stats["properties_extracted"] = len(all_properties)
+                scraping_stats["properties_extracted"] = n_props
                 scraping_stats["duplicates_skipped"] = (
-                    len(self.seen_property_hashes) - len(all_properties)
+                    len(self.seen_property_hashes) - n_props
                 )
                 scraping_stats["current_page"] = page_num
                 scraping_stats["last_update"] = datetime.now().isoformat()
@@ -1119,7 +1216,7 @@ class FixedFullScrapingPropertyMonitor:
                 # 🔎 DEBUG
                 print(
                     f"🔎 DEBUG: After page {page_num}, "
-                    f"unique_properties={len(all_properties)}, "
+                    f"unique_properties={n_props}, "
                     f"hashes_seen={len(self.seen_property_hashes)}, "
                     f"duplicates_skipped={scraping_stats['duplicates_skipped']}"
                 )
@@ -1128,21 +1225,18 @@ class FixedFullScrapingPropertyMonitor:
                 if page_num % 10 == 0:
                     self.save_scraping_progress(scraping_stats)
                     coverage = (
-                        (len(all_properties) / total_results) * 100
+                        (n_props / total_results) * 100
                         if total_results
                         else 0
                     )
                     print(
                         f"📊 Progress: {page_num}/{total_pages} pages, "
-                        f"{len(all_properties)} properties extracted "
+                        f"{n_props} properties extracted "
                         f"({coverage:.1f}% coverage)"
                     )
 
                 # Time limit guard (e.g. GitHub Actions 20 min)
-                elapsed_time = (
-                    datetime.now()
-                    - datetime.fromisoformat(scraping_stats["start_time"])
-                ).total_seconds()
+                elapsed_time = time.monotonic() - scan_start
                 if elapsed_time > 3600:
                     print(f"⏰ Time limit approaching, stopping at page {page_num}")
                     scraping_stats["stopped_early"] = True
@@ -1161,38 +1255,45 @@ class FixedFullScrapingPropertyMonitor:
                     break
                 continue
 
+        n_props = len(all_properties)
         scraping_stats["end_time"] = datetime.now().isoformat()
-        scraping_stats["total_properties_extracted"] = len(all_properties)
+        scraping_stats["total_properties_extracted"] = n_props
         scraping_stats["success_rate"] = (
             (scraping_stats["pages_completed"] / total_pages) * 100
             if total_pages
             else 0
         )
         scraping_stats["coverage_percentage"] = (
-            (len(all_properties) / total_results) * 100 if total_results else 0
+            (n_props / total_results) * 100 if total_results else 0
         )
 
         self.save_scraping_progress(scraping_stats)
 
-        print("\n" + "=" * 80)
-        print("📊 FIXED FULL SCRAPING COMPLETED")
-        print("=" * 80)
-        print(f"🌐 Total listings on site: {total_results:,}")
-        print(
-            f"📄 Pages scraped: {scraping_stats['pages_completed']}/{total_pages}"
-        )
-        print(f"🏠 Properties extracted: {len(all_properties)}")
-        print(
-            f"📈 Coverage: {scraping_stats['coverage_percentage']:.1f}%"
-        )
-        print(f"🔄 Duplicates skipped: {scraping_stats['duplicates_skipped']}")
-        print(
-            "⏱️ Duration: "
-            f"{(datetime.fromisoformat(scraping_stats['end_time']) - datetime.fromisoformat(scraping_stats['start_time'])).total_seconds():.0f} seconds"
+        duration = (
+            datetime.fromisoformat(scraping_stats["end_time"])
+            - datetime.fromisoformat(scraping_stats["start_time"])
+        ).total_seconds()
+        # One write for the whole block instead of a print() per line
+        sys.stdout.write(
+            "\n".join(
+                [
+                    "",
+                    _BAR,
+                    "📊 FIXED FULL SCRAPING COMPLETED",
+                    _BAR,
+                    f"🌐 Total listings on site: {total_fmt}",
+                    f"📄 Pages scraped: {scraping_stats['pages_completed']}/{total_pages}",
+                    f"🏠 Properties extracted: {n_props}",
+                    f"📈 Coverage: {scraping_stats['coverage_percentage']:.1f}%",
+                    f"🔄 Duplicates skipped: {scraping_stats['duplicates_skipped']}",
+                    f"⏱️ Duration: {duration:.0f} seconds",
+                    f"❌ Errors: {len(scraping_stats['errors'])}",
+                    f"✅ Success rate: {scraping_stats['success_rate']:.1f}%",
+                    _BAR,
+                    "",
+                ]
+            )
         )
-        print(f"❌ Errors: {len(scraping_stats['errors'])}")
-        print(f"✅ Success rate: {scraping_stats['success_rate']:.1f}%")
-        print("=" * 80)
 
         return all_properties, scraping_stats
 
@@ -1432,42 +1533,27 @@ class FixedFullScrapingPropertyMonitor:
             return False
 
         try:
-            url = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
+            url = self.telegram_url
             max_length = 4000
+            # Same chat and parse mode for every part; only the text changes
+            data = {"chat_id": self.telegram_chat_id, "parse_mode": "HTML"}
 
             if len(message) > max_length:
                 # Split on newline boundaries to avoid breaking HTML tags
-                parts = []
-                remaining = message
-                while len(remaining) > max_length:
-                    split_at = remaining.rfind("\n", 0, max_length)
-                    if split_at == -1:
-                        split_at = max_length
-                    parts.append(remaining[:split_at])
-                    remaining = remaining[split_at:].lstrip("\n")
-                parts.append(remaining)
+                parts = list(_iter_message_parts(message, max_length))
                 for i, part in enumerate(parts):
-                    data = {
-                        "chat_id": self.telegram_chat_id,
-                        "text": f"<b>Part {i+1}/{len(parts)}</b>\n\n{part}",
-                        "parse_mode": "HTML",
-                    }
-                    response = requests.post(url, data=data, timeout=10)
+                    data["text"] = f"<b>Part {i+1}/{len(parts)}</b>\n\n{part}"
+                    response = self._post_telegram(url, data)
                     if response.status_code != 200:
                         print(
                             f"❌ Telegram error for part {i+1}: "
                             f"{response.status_code} {response.text}"
                         )
                         return False
-                    time.sleep(1)
                 return True
             else:
-                data = {
-                    "chat_id": self.telegram_chat_id,
-                    "text": message,
-                    "parse_mode": "HTML",
-                }
-                response = requests.post(url, data=data, timeout=10)
+                data["text"] = message
+                response = self._post_telegram(url, data)
                 if response.status_code != 200:
                     print(
                         f"❌ Telegram error: {response.status_code} {response.text}"
@@ -1478,6 +1564,24 @@ class FixedFullScrapingPropertyMonitor:
             print(f"❌ Error sending Telegram notification: {e}")
             return False
 
+    def _post_telegram(self, url, data, max_attempts=3):
+        """POST to the Bot API, waiting out 429 rate limits as Telegram asks.
+
+        Sends immediately; only when Telegram answers 429 does it sleep for the
+        Retry-After seconds (default 1) and try again.
+        """
+        for attempt in range(max_attempts):
+            response = self.session.post(url, json=data, timeout=10)
+            if response.status_code != 429 or attempt == max_attempts - 1:
+                return response
+            try:
+                retry_after = int(response.headers.get("Retry-After", "1"))
+            except ValueError:
+                retry_after = 1
+            print(f"⏳ Telegram rate limited, retrying in {retry_after}s")
+            time.sleep(retry_after)
+        return response
+
     def _format_property_card(self, index, d, changes=None):
         """Format a single property card for Telegram HTML notification.
         Shows all available information."""
@@ -1510,12 +1614,11 @@ class FixedFullScrapingPropertyMonitor:
         # Price and auction date (or changes)
         if changes:
             for change in changes:
-                old = esc(change["old_value"])
-                new = esc(change["new_value"])
-                if change["type"] == "price_change":
-                    lines.append(f"   💰 <s>{old}</s> → <b>{new}</b>")
-                elif change["type"] == "auction_date_change":
-                    lines.append(f"   📅 <s>{old}</s> → <b>{new}</b>")
+                icon = _CHANGE_ICONS.get(change["type"])
+                if icon:
+                    old = esc(change["old_value"])
+                    new = esc(change["new_value"])
+                    lines.append(f"   {icon} <s>{old}</s> → <b>{new}</b>")
         else:
             price = d.get("price", "")
             auction = d.get("auction_date", "")
@@ -1539,78 +1642,106 @@ class FixedFullScrapingPropertyMonitor:
         total_tracked,
         total_on_site,
         scraping_stats,
+        now=None,
     ):
-        """Format scan summary for Telegram (HTML). Compact, scannable format."""
-        now = datetime.now()
+        """Format scan summary for Telegram (HTML). Compact, scannable format.
+
+        `now` is the run's start time, so the summary is dated like the
+        snapshot; defaults to the current time.
+        """
+        now = now or datetime.now()
         next_scan = now + timedelta(days=3)
         esc = self.tg_escape_html
-        has_alerts = len(new_listings) > 0 or len(changed_properties) > 0
+        scan_date = esc(now.strftime('%d %b %Y'))
+        footer = (
+            f"\n⏭ Next scan: {esc(next_scan.strftime('%d %b %Y, 9:00 PM'))}\n"
+            "🔍 Send /help to search properties"
+        )
 
-        # Header
-        if has_alerts:
-            msg = f"🚨 <b>LELONG SCAN</b> — {esc(now.strftime('%d %b %Y'))}\n\n"
-        else:
-            msg = f"📊 <b>LELONG SCAN</b> — {esc(now.strftime('%d %b %Y'))}\n\n"
+        # Stable day: nothing to list, so skip the per-property sections entirely
+        if not new_listings and not changed_properties:
+            return (
+                f"📊 <b>LELONG SCAN</b> — {scan_date}\n\n"
+                f"<b>{total_tracked:,}</b> tracked · <b>0</b> new · <b>0</b> changed\n"
+                "\n✨ No new listings or changes — market is stable.\n"
+                + footer
+            )
 
-        # Headline stats
-        msg += (
+        summary = self._summarize_changes(new_listings, changed_properties)
+        n_new = summary["n_new"]
+        n_changed = summary["n_changed"]
+
+        # Header and headline stats
+        parts = [
+            f"🚨 <b>LELONG SCAN</b> — {scan_date}\n\n",
             f"<b>{total_tracked:,}</b> tracked · "
-            f"<b>{len(new_listings)}</b> new · "
-            f"<b>{len(changed_properties)}</b> changed\n"
-        )
+            f"<b>{n_new}</b> new · "
+            f"<b>{n_changed}</b> changed\n",
+        ]
 
         # New listings (top 5)
-        if new_listings:
-            msg += f"\n🆕 <b>NEW ({len(new_listings)}):</b>\n"
-            for i, (prop_id, d) in enumerate(list(new_listings.items())[:5], 1):
-                msg += "\n" + self._format_property_card(i, d)
+        if n_new:
+            parts.append(f"\n🆕 <b>NEW ({n_new}):</b>\n")
+            for i, d in enumerate(summary["top_new"], 1):
+                parts.append("\n" + self._format_property_card(i, d))
 
-            if len(new_listings) > 5:
-                msg += f"\n   <i>+{len(new_listings) - 5} more — send /new to see all</i>\n"
+            if summary["more_new"]:
+                parts.append(f"\n   <i>+{summary['more_new']} more — send /new to see all</i>\n")
 
         # Changed properties (top 5)
-        if changed_properties:
-            msg += f"\n🔄 <b>CHANGES ({len(changed_properties)}):</b>\n"
-            for i, (prop_id, data) in enumerate(list(changed_properties.items())[:5], 1):
-                prop = data["property"]
-                changes = data["changes"]
-                msg += "\n" + self._format_property_card(i, prop, changes=changes)
-
-            if len(changed_properties) > 5:
-                msg += f"\n   <i>+{len(changed_properties) - 5} more — send /changes to see all</i>\n"
-
-        # No alerts
-        if not has_alerts:
-            msg += "\n✨ No new listings or changes — market is stable.\n"
+        if n_changed:
+            parts.append(f"\n🔄 <b>CHANGES ({n_changed}):</b>\n")
+            for i, (prop, changes) in enumerate(summary["top_changed"], 1):
+                parts.append("\n" + self._format_property_card(i, prop, changes=changes))
+
+            if summary["more_changed"]:
+                parts.append(
+                    f"\n   <i>+{summary['more_changed']} more — send /changes to see all</i>\n"
+                )
 
         # Footer
-        msg += f"\n⏭ Next scan: {esc(next_scan.strftime('%d %b %Y, 9:00 PM'))}\n"
-        msg += "🔍 Send /help to search properties"
-
-        return msg
+        parts.append(footer)
+
+        return "".join(parts)
+
+    def _summarize_changes(self, new_listings, changed_properties, top=5):
+        """Reduce a scan's new/changed listings to the data the summary shows:
+        counts, the first `top` of each, and how many were left out."""
+        n_new = len(new_listings)
+        n_changed = len(changed_properties)
+        return {
+            "n_new": n_new,
+            "n_changed": n_changed,
+            "top_new": list(islice(new_listings.values(), top)),
+            "top_changed": [
+                (data["property"], data["changes"])
+                for data in islice(changed_properties.values(), top)
+            ],
+            "more_new": max(n_new - top, 0),
+            "more_changed": max(n_changed - top, 0),
+        }
 
     # ---------- Main ----------
-    def save_snapshot(self, properties, scraping_stats):
+    def save_snapshot(self, properties, scraping_stats, scan_ts=None):
         """Save raw scrape snapshot to data/snapshots/YYYY-MM-DD.json"""
         snapshots_dir = self.data_path / "snapshots"
         snapshots_dir.mkdir(exist_ok=True)
-        date_str = datetime.now().strftime("%Y-%m-%d")
+        scan_ts = scan_ts or datetime.now().isoformat()
+        date_str = scan_ts[:10]  # ISO timestamp starts with YYYY-MM-DD
         snapshot_path = snapshots_dir / f"{date_str}.json"
         snapshot = {
-            "scan_date": datetime.now().isoformat(),
+            "scan_date": scan_ts,
             "scraping_stats": scraping_stats,
             "properties": properties,
         }
-        with open(snapshot_path, "w") as f:
-            json.dump(snapshot, f, indent=2, ensure_ascii=False)
+        snapshot_path.write_bytes(_json_bytes(snapshot))
         print(f"Snapshot saved: {snapshot_path} ({len(properties)} properties)")
         return snapshot_path
 
     def run_monitoring(self):
         """Main monitoring function: scrape, save snapshot, then reprocess."""
-        print(
-            f"Starting scrape at {datetime.now()}"
-        )
+        run_start = datetime.now()
+        print(f"Starting scrape at {run_start}")
 
         # Attempt login for full details (unit numbers in addresses)
         self.login()
@@ -1632,20 +1763,24 @@ class FixedFullScrapingPropertyMonitor:
                 self.send_telegram_notification(error_message)
                 return "Scraping failed"
 
+            # One timestamp for the whole scan: property records, snapshot,
+            # changes history, stats and the summary date all carry the scan
+            # start time
+            scan_ts = self.scan_timestamp
+
             # Save raw snapshot — this is the source of truth
-            self.save_snapshot(current_properties, scraping_stats)
+            self.save_snapshot(current_properties, scraping_stats, scan_ts)
 
             # Reprocess all snapshots to rebuild database
-            from reprocess import reprocess_all
             database, new_listings, changed_properties = reprocess_all(
                 self.data_path
             )
 
             # Save derived data files
             self.save_properties_database(database)
-            self.save_changes_history(new_listings, changed_properties)
+            self.save_changes_history(new_listings, changed_properties, scan_ts)
             self.save_daily_stats(
-                current_properties, new_listings, changed_properties, len(database)
+                current_properties, new_listings, changed_properties, len(database), scan_ts
             )
 
             summary_message = self.format_fixed_daily_summary(
@@ -1655,6 +1790,7 @@ class FixedFullScrapingPropertyMonitor:
                 len(database),
                 total_results,
                 scraping_stats,
+                now=datetime.fromisoformat(scan_ts),
             )
 
             if self.send_telegram_notification(summary_message):
@@ -1684,7 +1820,9 @@ class FixedFullScrapingPropertyMonitor:
                     "Will retry in 3 days."
                 )
                 self.send_telegram_notification(error_notification)
-            raise e
+            raise
+        finally:
+            self.close()
 
 
 if __name__ == "__main__":
@@ -13,15 +13,41 @@ import re
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson  # optional C-accelerated JSON, see requirements.txt
+except ImportError:
+    orjson = None
+
 
 DATA_DIR = Path(os.path.dirname(__file__)).parent / "data"
 
+_WS_RE = re.compile(r"\s+")
+_DIGITS_RE = re.compile(r"\d+")
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+
+# Most recent entries kept per price/auction-date history
+_MAX_HISTORY = 50
+
+
+# JSON helpers shared with monitor.py, which imports them from here
+
+def _json_loads(raw):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _json_bytes(obj):
+    """Serialize to indented UTF-8 JSON; orjson and the stdlib fallback
+    produce the same bytes for our data."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 def normalize_text(s):
     if not s:
         return ""
     s = s.strip().lower()
-    s = re.sub(r"\s+", " ", s)
+    s = _WS_RE.sub(" ", s)
     return s
 
 
@@ -29,7 +55,7 @@ def normalize_size(s):
     if not s:
         return ""
     s = s.lower()
-    digits = re.findall(r"\d+", s)
+    digits = _DIGITS_RE.findall(s)
     num = "".join(digits) if digits else ""
     unit = "sqft" if "sq.ft" in s or "sqft" in s else ""
     return f"{num}{unit}"
@@ -45,13 +71,15 @@ def generate_stable_key(prop):
 
 
 def create_property_id(title, location, size, address=""):
-    """Create a stable property ID from title+location+size+address."""
-    clean_title = re.sub(r"[^\w\s]", "", title)
-    clean_location = re.sub(r"[^\w\s]", "", location)
-    clean_size = re.sub(r"[^\w\s]", "", size)
-    clean_address = re.sub(r"[^\w\s]", "", address or "")
-    base = f"{clean_title}_{clean_location}_{clean_size}_{clean_address}".strip()
-    base = re.sub(r"\s+", "_", base).lower()
+    """Create a stable property ID from title+location+size+address.
+
+    Must stay in step with FixedFullScrapingPropertyMonitor.create_property_id
+    in monitor.py; the monitor's direct ID match relies on both agreeing.
+    """
+    # Punctuation removal is per character, so cleaning the joined fields
+    # once equals cleaning each field and then joining
+    base = _NON_WORD_RE.sub("", f"{title}_{location}_{size}_{address or ''}").strip()
+    base = _WS_RE.sub("_", base).lower()
     if not base:
         base = "property"
     return base[:150]
@@ -67,8 +95,7 @@ def load_snapshots(data_dir):
     snapshots = []
     for path in snapshot_files:
         try:
-            with open(path) as f:
-                data = json.load(f)
+            data = _json_loads(path.read_bytes())
             snapshots.append(data)
             print(f"  Loaded {path.name}: {len(data.get('properties', {}))} properties")
         except Exception as e:
@@ -160,25 +187,25 @@ def reprocess_all(data_dir=None):
             )
 
             if existing_id is None:
-                # New property
-                database[prop_id] = {
-                    **prop,
-                    "_stable_key": sk,
-                    "first_seen": prop.get("last_updated", scan_date),
-                    "price_history": [
-                        {
-                            "price": prop.get("price", ""),
-                            "date": prop.get("last_updated", scan_date),
-                            "url": prop.get("listing_url", ""),
-                        }
-                    ],
-                    "auction_date_history": [
-                        {
-                            "auction_date": prop.get("auction_date", ""),
-                            "date": prop.get("last_updated", scan_date),
-                        }
-                    ],
-                }
+                # New property. The snapshot dict is only read here, so it
+                # becomes the database record instead of being copied.
+                seen_at = prop.get("last_updated", scan_date)
+                prop["_stable_key"] = sk
+                prop["first_seen"] = seen_at
+                prop["price_history"] = [
+                    {
+                        "price": prop.get("price", ""),
+                        "date": seen_at,
+                        "url": prop.get("listing_url", ""),
+                    }
+                ]
+                prop["auction_date_history"] = [
+                    {
+                        "auction_date": prop.get("auction_date", ""),
+                        "date": seen_at,
+                    }
+                ]
+                database[prop_id] = prop
                 stable_index[sk] = prop_id
                 lid = prop.get("listing_id", "")
                 if lid:
@@ -192,37 +219,42 @@ def reprocess_all(data_dir=None):
             else:
                 # Existing property — check for changes
                 changes = []
+                seen_at = prop.get("last_updated", scan_date)
+                price = prop.get("price", "")
+                old_price = existing_data.get("price", "")
+                auction_date = prop.get("auction_date", "")
+                old_auction_date = existing_data.get("auction_date", "")
 
-                if prop.get("price", "") != existing_data.get("price", ""):
+                if price != old_price:
                     changes.append({
                         "type": "price_change",
                         "field": "Auction Price",
-                        "old_value": existing_data.get("price", ""),
-                        "new_value": prop.get("price", ""),
-                        "change_date": prop.get("last_updated", scan_date),
+                        "old_value": old_price,
+                        "new_value": price,
+                        "change_date": seen_at,
                     })
-                    if "price_history" not in existing_data:
-                        existing_data["price_history"] = []
-                    existing_data["price_history"].append({
-                        "price": prop.get("price", ""),
-                        "date": prop.get("last_updated", scan_date),
+                    history = existing_data.setdefault("price_history", [])
+                    history.append({
+                        "price": price,
+                        "date": seen_at,
                         "url": prop.get("listing_url", ""),
                     })
+                    del history[:-_MAX_HISTORY]
 
-                if prop.get("auction_date", "") != existing_data.get("auction_date", ""):
+                if auction_date != old_auction_date:
                     changes.append({
                         "type": "auction_date_change",
                         "field": "Auction Date",
-                        "old_value": existing_data.get("auction_date", ""),
-                        "new_value": prop.get("auction_date", ""),
-                        "change_date": prop.get("last_updated", scan_date),
+                        "old_value": old_auction_date,
+                        "new_value": auction_date,
+                        "change_date": seen_at,
                     })
-                    if "auction_date_history" not in existing_data:
-                        existing_data["auction_date_history"] = []
-                    existing_data["auction_date_history"].append({
-                        "auction_date": prop.get("auction_date", ""),
-                        "date": prop.get("last_updated", scan_date),
+                    history = existing_data.setdefault("auction_date_history", [])
+                    history.append({
+                        "auction_date": auction_date,
+                        "date": seen_at,
                     })
+                    del history[:-_MAX_HISTORY]
 
                 # Update with latest data but keep first_seen and histories
                 first_seen = existing_data.get("first_seen", "")
@@ -256,8 +288,7 @@ if __name__ == "__main__":
 
     # Save the rebuilt database
     props_path = DATA_DIR / "properties.json"
-    with open(props_path, "w") as f:
-        json.dump(database, f, indent=2, ensure_ascii=False)
+    props_path.write_bytes(_json_bytes(database))
     print(f"Saved {len(database)} properties to {props_path}")
 
     # Save changes history
@@ -265,8 +296,7 @@ if __name__ == "__main__":
     existing_changes = []
     if changes_path.exists():
         try:
-            with open(changes_path) as f:
-                existing_changes = json.load(f)
+            existing_changes = _json_loads(changes_path.read_bytes())
         except Exception:
             pass
 
@@ -287,8 +317,7 @@ if __name__ == "__main__":
         "changes": change_records,
     }
     existing_changes.append(entry)
-    with open(changes_path, "w") as f:
-        json.dump(existing_changes, f, indent=2, ensure_ascii=False)
+    changes_path.write_bytes(_json_bytes(existing_changes))
 
     # Save daily stats
     stats_path = DATA_DIR / "daily_stats.json"
@@ -298,7 +327,6 @@ if __name__ == "__main__":
         "new_listings": len(new_listings),
         "changed_properties": len(changed_properties),
     }
-    with open(stats_path, "w") as f:
-        json.dump(stats, f, indent=2, ensure_ascii=False)
+    stats_path.write_bytes(_json_bytes(stats))
 
     print(f"New: {len(new_listings)}, Changed: {len(changed_properties)}")